@@ -1,14 +1,19 @@
 #!/usr/bin/env python3
 
+from collections import Counter
+from functools import lru_cache
 from itertools import groupby
+from operator import attrgetter
 import sys
 import re
 from openpyxl.styles.fills import PatternFill
 from openpyxl.styles.fonts import Font
 from openpyxl.workbook import Workbook
-from openpyxl.styles import Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.worksheet.cell_range import CellRange
+from openpyxl.styles import Alignment, Border, NamedStyle, Side
 from openpyxl.utils import get_column_letter
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 
 FOOTER_TEXT = (
@@ -17,16 +22,35 @@ FOOTER_TEXT = (
 )
 
 BELL_NAMES = "1234567890ETABCD"
+# Maps each bell name to its (1-indexed) bell number
+BELL_NUMBERS = {name: idx + 1 for idx, name in enumerate(BELL_NAMES)}
 
+# Rows are stored as `bytes` of 0-indexed bells (so rounds is `b"\x00\x01...\x07"`), which
+# lets us transpose rows without converting between bell names and indices
 STAGE = 8
-TENOR = BELL_NAMES[STAGE - 1]
-ROUNDS = BELL_NAMES[:STAGE]
+TENOR = STAGE - 1
+ROUNDS = bytes(range(STAGE))
+# Calling positions, indexed by the place of the tenor at the lead head after the call
+BOB_CALLING_POSITIONS = "LIBFVMWH"
+SINGLE_CALLING_POSITIONS = "LBTFVMWH"
+# 4-bell runs which we count at the front or back of a row
+RUN_SET = frozenset(
+    bytes(BELL_NUMBERS[bell] - 1 for bell in run)
+    for run in ("1234", "2345", "3456", "4567", "5678", "4321", "5432", "6543", "7654", "8765")
+)
+
+# I could do many things to make this regex more readable: like, for example, not using a regex.
+# Instead I will leave understanding this regex as a challenge for the reader.
+LINE_SPLIT_RE = re.compile(
+    r"^\s*(?P<length>\d+)\s+(?P<calling>\S+)(\s+(?P<notes>\S.+?))?\s*$",
+)
+LEAD_RE = re.compile(r"(?P<method>[a-zA-Z])(?P<call>[*.])?")
 
 
 def main():
     method_set = load_methods()
     touches = read_touches(sys.argv[1], method_set)
-    touches.sort(key=lambda touch: (touch.length, -touch.runs))
+    touches.sort(key=attrgetter("sort_key"))
     write_spreadsheet(method_set, touches, sys.argv[2])
     print(f"Written {len(touches)} touches")
 
@@ -97,10 +121,11 @@ class Method:
             lead_rows.append(current_row)
             current_row = transpose_row_by_pn(current_row, places)
 
-        self.lead_rows: List[str] = lead_rows
-        self.lead_head_plain: str = current_row
-        self.lead_head_bob: str = transpose_row_by_pn(lead_rows[-1], BOB_PLACES)
-        self.lead_head_single: str = transpose_row_by_pn(lead_rows[-1], SINGLE_PLACES)
+        self.lead_rows: Tuple[bytes, ...] = tuple(lead_rows)
+        self.lead_length: int = len(lead_rows)
+        self.lead_head_plain: bytes = current_row
+        self.lead_head_bob: bytes = transpose_row_by_pn(lead_rows[-1], BOB_PLACES)
+        self.lead_head_single: bytes = transpose_row_by_pn(lead_rows[-1], SINGLE_PLACES)
 
 
 ###################
@@ -109,27 +134,23 @@ class Method:
 
 
 def read_touches(path: str, method_set: MethodSet) -> List["Touch"]:
-    # I could do many things to make this regex more readable: like, for example, not using a regex.
-    # Instead I will leave understanding this regex as a challenge for the reader.
-    line_split_regex = re.compile(
-        r"^\s*(?P<length>\d+)\s+(?P<calling>\S+)(\s+(?P<notes>\S.+?))?\s*$",
-    )
-
     touches = []
-    for line in open(path).read().splitlines(False):
-        if line.lstrip().startswith("#"):
-            continue
+    with open(path) as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if line.lstrip().startswith("#"):
+                continue
 
-        re_match = line_split_regex.match(line)
-        if re_match is None:
-            print(f"Can't parse line {line.__repr__()}")
-            exit(1)
+            re_match = LINE_SPLIT_RE.match(line)
+            if re_match is None:
+                print(f"Can't parse line {line.__repr__()}")
+                exit(1)
 
-        length = int(re_match.group("length"))
-        call_string = re_match.group("calling")
-        notes = re_match.group("notes")
+            length = int(re_match.group("length"))
+            call_string = re_match.group("calling")
+            notes = re_match.group("notes")
 
-        touches.append(Touch(length, call_string, notes, method_set.methods))
+            touches.append(Touch(length, call_string, notes, method_set.methods))
 
     return touches
 
@@ -143,22 +164,15 @@ class Touch:
         self.notes = notes
 
         # Parse the call string into a sequence of leads
-        lead_regex = re.compile(r"(?P<method>[a-zA-Z])(?P<call>[*.])?")
         leads = [
-            (match.group("method"), match.group("call"))
-            for match in lead_regex.finditer(call_string)
+            (match.group("method"), match.group("call")) for match in LEAD_RE.finditer(call_string)
         ]
 
-        # Convert the lead sequence into a sequence of rows and a calling string
-        rows, calls, last_lead_length = gen_rows_and_calls(call_string, leads, methods)
+        # Walk through the lead sequence, counting the rows and runs and collecting the calls
+        num_rows, calls, last_lead_length, self.runs = walk_leads(call_string, leads, methods)
 
         # Determine which methods are rung
-        self.method_counts = {}
-        for shorthand, _ in leads:
-            if shorthand in self.method_counts:
-                self.method_counts[shorthand] += 1
-            else:
-                self.method_counts[shorthand] = 1
+        self.method_counts = Counter(shorthand for shorthand, _ in leads)
         # The last lead must be handled differently.  If we ring less than half a lead, then that
         # method should *only* be counted if it hasn't already been rung.  For example, both the
         # following should have one lead of Yorkshire:
@@ -168,7 +182,7 @@ class Touch:
         # have a method that's actually included (even for two rows) but doesn't show up in the
         # list.
         last_shorthand, _ = leads[-1]
-        len_of_last_methods_lead = len(methods[last_shorthand].lead_rows)
+        len_of_last_methods_lead = methods[last_shorthand].lead_length
         # Make sure that `self.call_string` ends with `>` iff there's snap finish
         self.call_string = self.call_string.rstrip(">")
         if last_lead_length < len_of_last_methods_lead:
@@ -178,79 +192,110 @@ class Touch:
             self.method_counts[last_shorthand] = max(1, self.method_counts[last_shorthand] - 1)
 
         # Check that the given length was correct
-        if self.length != len(rows):
+        if self.length != num_rows:
             raise ValueError(
-                f"{self.call_string} is given len {self.length} but has {len(rows)} rows"
+                f"{self.call_string} is given len {self.length} but has {num_rows} rows"
             )
-        # Count runs
-        run_regex_front = re.compile("^(1234|2345|3456|4567|5678|4321|5432|6543|7654|8765).*$")
-        run_regex_back = re.compile("^.*(1234|2345|3456|4567|5678|4321|5432|6543|7654|8765)$")
-        self.runs = 0
-        for row in rows:
-            if run_regex_front.match(row):
-                self.runs += 1
-            if run_regex_back.match(row):
-                self.runs += 1
+        # Touches are sorted by length, then with the most runs first
+        self.sort_key = (self.length, -self.runs)
 
         # Generate calling position string
-        self.calling_position_string = ""
+        calling_position_parts = []
         for position, calls in groupby(calls, lambda call_pos: call_pos[1]):
             calls = [call for call, _ in calls]
             # Add the calls as efficiently as possible
             if all((call == "-" for call in calls)):
                 # If all bobs, add nothing for one bob and a number for more than one
                 if len(calls) > 1:
-                    self.calling_position_string += str(len(calls))
+                    calling_position_parts.append(str(len(calls)))
             else:
                 # If not all bobs, then just squash all the calls together
-                for call in calls:
-                    self.calling_position_string += call
+                calling_position_parts.extend(calls)
             # Always add the position
-            self.calling_position_string += position
+            calling_position_parts.append(position)
+        self.calling_position_string = "".join(calling_position_parts)
 
 
-def gen_rows_and_calls(
+def walk_leads(
     call_string: str, leads, methods: Dict[str, Method]
-) -> Tuple[List[str], List[Tuple[str, str]], int]:
+) -> Tuple[int, List[Tuple[str, str]], int, int]:
+    """Rings through `leads`, returning the number of rows, the calls (with their calling
+    positions), the number of rows rung in the last lead and the number of runs."""
+    # Only the number of rows is needed (runs are counted per lead), so the rows themselves never
+    # get collected into a list
     calls = []
-    rows = []
+    num_rows = 0
+    runs = 0
     lead_head = ROUNDS
     last_lead_length = 0
+    comes_round_early = False
     for method_shorthand, call_shorthand in leads:
         method = methods[method_shorthand]
-        # Add the rows for this lead
-        rows += [transpose_row_by_row(lead_head, row) for row in method.lead_rows]
-        # Decide which lead head to go to
-        if call_shorthand is None:
-            lead_head = transpose_row_by_row(lead_head, method.lead_head_plain)
-        elif call_shorthand == ".":
-            lead_head = transpose_row_by_row(lead_head, method.lead_head_bob)
-            calls.append(("-", calling_pos_at(lead_head, is_single=False)))
-        elif call_shorthand == "*":
-            lead_head = transpose_row_by_row(lead_head, method.lead_head_single)
-            calls.append(("s", calling_pos_at(lead_head, is_single=True)))
+        # Add the rows for this lead, stopping if we hit rounds.  Rounds always appears at the
+        # start, but snap finishes will make rounds appear again part-way through the last lead
+        lead_rows = expand_lead(lead_head, method)
+        if num_rows > 0 and ROUNDS in lead_rows:
+            comes_round_early = True
+            lead_rows = lead_rows[: lead_rows.index(ROUNDS)]
+            runs += count_runs(lead_rows)
         else:
-            raise ValueError(f"Invalid call {call_shorthand}")
-        last_lead_length = len(method.lead_rows)
-    # Check for early rounds
-    try:
-        # Rounds always appears at the start, but snap finishes will make rounds appear again
-        rounds_index = rows.index(ROUNDS, 1)
-        # Remove the rows after rounds from the last lead
-        last_lead_length -= len(rows) - rounds_index
-        # Trim anything from rounds onwards
-        rows = rows[:rounds_index]
-    except ValueError:
-        # Rounds doesn't appear early, so check that the comp comes round
-        if lead_head != ROUNDS:
-            print(f"{call_string} doesn't come round")
-            assert False
-
-    return (rows, calls, last_lead_length)
-
-
-def calling_pos_at(row: str, is_single: bool = False) -> str:
-    calling_positions = "LBTFVMWH" if is_single else "LIBFVMWH"
+            runs += runs_in_lead(lead_head, method)
+        num_rows += len(lead_rows)
+        last_lead_length = len(lead_rows)
+        # Decide which lead head to go to
+        lead_head, call = next_lead_head(lead_head, method, call_shorthand)
+        if call is not None:
+            calls.append(call)
+        if comes_round_early:
+            break
+    # If rounds doesn't appear early, then check that the comp comes round at a lead end
+    if not comes_round_early and lead_head != ROUNDS:
+        print(f"{call_string} doesn't come round")
+        assert False
+
+    return (num_rows, calls, last_lead_length, runs)
+
+
+@lru_cache(maxsize=None)
+def expand_lead(lead_head: bytes, method: Method) -> Tuple[bytes, ...]:
+    """Returns the rows of a lead of `method` starting from `lead_head`.  Lead heads repeat a lot
+    between (and within) touches, so these are cached."""
+    return tuple(transpose_row_by_row(lead_head, row) for row in method.lead_rows)
+
+
+@lru_cache(maxsize=None)
+def runs_in_lead(lead_head: bytes, method: Method) -> int:
+    """Returns the number of runs in the lead given by `expand_lead(lead_head, method)`.  Cached
+    for the same reason, so most leads' runs are only counted once."""
+    return count_runs(expand_lead(lead_head, method))
+
+
+def count_runs(rows: Iterable[bytes]) -> int:
+    """Counts the 4-bell runs at the front and back of some rows"""
+    return sum((row[:4] in RUN_SET) + (row[-4:] in RUN_SET) for row in rows)
+
+
+@lru_cache(maxsize=None)
+def next_lead_head(
+    lead_head: bytes, method: Method, call_shorthand: Optional[str]
+) -> Tuple[bytes, Optional[Tuple[str, str]]]:
+    """Returns the lead head reached after a lead of `method` from `lead_head`, along with the call
+    and its calling position (if a call is made).  Like `expand_lead`, this is cached so touches
+    end up walking a table of lead head transitions which is built up as it's needed."""
+    if call_shorthand is None:
+        return (transpose_row_by_row(lead_head, method.lead_head_plain), None)
+    elif call_shorthand == ".":
+        new_lead_head = transpose_row_by_row(lead_head, method.lead_head_bob)
+        return (new_lead_head, ("-", calling_pos_at(new_lead_head, is_single=False)))
+    elif call_shorthand == "*":
+        new_lead_head = transpose_row_by_row(lead_head, method.lead_head_single)
+        return (new_lead_head, ("s", calling_pos_at(new_lead_head, is_single=True)))
+    else:
+        raise ValueError(f"Invalid call {call_shorthand}")
+
+
+def calling_pos_at(row: bytes, is_single: bool = False) -> str:
+    calling_positions = SINGLE_CALLING_POSITIONS if is_single else BOB_CALLING_POSITIONS
     return calling_positions[row.index(TENOR)]
 
 
@@ -283,13 +328,11 @@ def write_spreadsheet(method_set: MethodSet, touches: List[Touch], path: str):
     #     |                                   <note on calls>
     #     +----+--------+-----+-----+------+--------+--------+-------+---------------
 
-    workbook = Workbook()
-    sheet = workbook.active
-
     vertical_text = Alignment(text_rotation=90, horizontal="right")
     left_text = Alignment(horizontal="left", vertical="top")
     centre_text = Alignment(horizontal="center", vertical="top")
     right_text = Alignment(horizontal="right", vertical="top")
+    middle_text = Alignment(horizontal="center", vertical="center")
 
     FONT_FAMILY = "EB Garamond"
     FONT_SIZE = 10
@@ -301,6 +344,42 @@ def write_spreadsheet(method_set: MethodSet, touches: List[Touch], path: str):
     THIN = Side(style="thin", color=GREY_BORDER_COLOUR)
     THICK_BOX = Border(left=THICK, right=THICK, top=THICK, bottom=THICK)
 
+    # Styles which are used by many cells are only created once, so that openpyxl doesn't have to
+    # build and hash a new copy for every cell
+    DEFAULT_FONT = Font(name=FONT_FAMILY, size=FONT_SIZE)
+    CODE_FONT = Font(name="Fira Code", size=FONT_SIZE)
+    MATRIX_FILL = PatternFill(patternType="solid", fgColor=MATRIX_CELL_FILL)
+
+    # The workbook is write-only, which means that cells have to be written in order.  So the sheet
+    # is laid out into `cells`, and only streamed into the sheet once everything is in place
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    # Applying a named style to a cell just copies its style IDs, whereas setting `cell.font`
+    # directly makes openpyxl hash the font to look it up
+    workbook.add_named_style(NamedStyle(name="Body", font=DEFAULT_FONT))
+    # Every touch's row uses the same few combinations of styles, so these get named styles too
+    workbook.add_named_style(
+        NamedStyle(name="Touch Info", font=DEFAULT_FONT, alignment=centre_text)
+    )
+    workbook.add_named_style(NamedStyle(name="Calling", font=CODE_FONT, alignment=left_text))
+    workbook.add_named_style(
+        NamedStyle(name="Calling Positions", font=CODE_FONT, alignment=centre_text)
+    )
+    workbook.add_named_style(NamedStyle(name="Method Matrix", font=CODE_FONT, fill=MATRIX_FILL))
+    cells: Dict[Tuple[int, int], WriteOnlyCell] = {}
+
+    def get_cell(row: int, column: int) -> WriteOnlyCell:
+        if (row, column) not in cells:
+            cell = WriteOnlyCell(sheet)
+            cell.style = "Body"
+            cells[(row, column)] = cell
+        return cells[(row, column)]
+
+    def merge_cells(start_row: int, start_column: int, end_row: int, end_column: int):
+        sheet.merged_cells.add(
+            CellRange(min_row=start_row, min_col=start_column, max_row=end_row, max_col=end_column)
+        )
+
     num_methods = len(method_set.methods)
     methods_col = 1
     info_col = 1 + num_methods
@@ -312,43 +391,39 @@ def write_spreadsheet(method_set: MethodSet, touches: List[Touch], path: str):
     notes_col = info_col + 1
     calling_col = info_col + 2
     runs_col = info_col + 4
-    all_info_cols = [length_col, notes_col, calling_col, calling_col + 1, runs_col]
-
-    # Set default font for all cells
-    def set_col_font(col):
-        for row in range(3 + len(touches) + 1):
-            sheet.cell(top_row + row, col).font = Font(name=FONT_FAMILY, size=FONT_SIZE)
 
+    # Set default font for all cells.  Every cell is given this font when it's created (see
+    # `get_cell`), so only the cells which stay blank need to get it from their column
     for m_idx in range(num_methods):
-        set_col_font(methods_col + m_idx)
+        sheet.column_dimensions[get_column_letter(methods_col + m_idx)].font = DEFAULT_FONT
     for i_idx in range(info_width):
-        set_col_font(info_col + i_idx)
+        sheet.column_dimensions[get_column_letter(info_col + i_idx)].font = DEFAULT_FONT
 
     # === TOP-LEFT CORNER ===
     # title
-    sheet.merge_cells(
+    merge_cells(
         start_column=info_col,
         start_row=top_row + 0,
         end_column=info_col + info_width - 1,
         end_row=top_row + 0,
     )
-    title_cell = sheet.cell(top_row, info_col)
+    title_cell = get_cell(top_row, info_col)
     title_cell.value = f"{len(touches)} Lincoln Touches"
     title_cell.font = Font(name=FONT_FAMILY, size=FONT_SIZE * 4, bold=True)
-    title_cell.alignment = Alignment(horizontal="center", vertical="center")
+    title_cell.alignment = middle_text
     # made by me
-    sheet.merge_cells(
+    merge_cells(
         start_column=info_col,
         start_row=top_row + 1,
         end_column=info_col + info_width - 1,
         end_row=top_row + 1,
     )
-    made_by_me_cell = sheet.cell(top_row + 1, info_col + 0)
+    made_by_me_cell = get_cell(top_row + 1, info_col + 0)
     made_by_me_cell.value = "Compiled by Ben White-Horne"
     made_by_me_cell.font = Font(name=FONT_FAMILY, size=FONT_SIZE * 1.6, bold=True)
-    made_by_me_cell.alignment = Alignment(horizontal="center", vertical="center")
+    made_by_me_cell.alignment = middle_text
     # merge calling header cells
-    sheet.merge_cells(
+    merge_cells(
         start_column=calling_col,
         start_row=top_row + 2,
         end_column=calling_col + 1,
@@ -361,7 +436,7 @@ def write_spreadsheet(method_set: MethodSet, touches: List[Touch], path: str):
         (runs_col, "Runs"),
     ]
     for col, label in headers:
-        cell = sheet.cell(top_row + 2, col)
+        cell = get_cell(top_row + 2, col)
         # 'Runs' and 'Length' look better right-aligned.  It seems that Google Sheets' text width
         # calculation isn't quite accurate, and for short words it's obvious that the text ends up
         # not exactly in the middle of the cell.
@@ -377,26 +452,26 @@ def write_spreadsheet(method_set: MethodSet, touches: List[Touch], path: str):
         if not method.name.startswith(shorthand):
             name += f" ({shorthand})"
         # Set the cell
-        sheet.merge_cells(
+        merge_cells(
             start_column=column,
             start_row=top_row,
             end_column=column,
             end_row=top_row + 1,
         )
-        cell = sheet.cell(column=column, row=top_row)
+        cell = get_cell(column=column, row=top_row)
         cell.value = name
         cell.alignment = vertical_text
     # Groups
     start_col = methods_col
     groups_row = top_row + 2
     for name, width in method_set.groups:
-        sheet.merge_cells(
+        merge_cells(
             start_column=start_col,
             start_row=groups_row,
             end_column=start_col + width - 1,
             end_row=groups_row,
         )
-        cell = sheet.cell(groups_row, start_col)
+        cell = get_cell(groups_row, start_col)
         cell.value = name
         cell.alignment = centre_text
         start_col += width
@@ -404,44 +479,42 @@ def write_spreadsheet(method_set: MethodSet, touches: List[Touch], path: str):
     # === TOUCHES ===
     for idx, touch in enumerate(touches):
         row = first_touch_row + idx
-        # Alignment (only the `calling` column is left-aligned)
-        for col in all_info_cols:
-            sheet.cell(row, col).alignment = left_text if col == calling_col else centre_text
+        # Styles (only the `calling` column is left-aligned)
+        for col in [length_col, notes_col, runs_col]:
+            get_cell(row, col).style = "Touch Info"
+        get_cell(row, calling_col).style = "Calling"
+        get_cell(row, calling_col + 1).style = "Calling Positions"
         # Touch info
-        for col in [calling_col, calling_col + 1]:
-            sheet.cell(row, col).font = Font(name="Fira Code", size=FONT_SIZE)
-        sheet.cell(row, length_col).value = touch.length
-        sheet.cell(row, calling_col).value = touch.call_string
-        sheet.cell(row, calling_col + 1).value = touch.calling_position_string
-        sheet.cell(row, runs_col).value = touch.runs
-        sheet.cell(row, notes_col).value = touch.notes
+        get_cell(row, length_col).value = touch.length
+        get_cell(row, calling_col).value = touch.call_string
+        get_cell(row, calling_col + 1).value = touch.calling_position_string
+        get_cell(row, runs_col).value = touch.runs
+        get_cell(row, notes_col).value = touch.notes
         # Method Matrix
         for meth_idx, shorthand in enumerate(method_set.methods):
             if shorthand in touch.method_counts:
-                cell = sheet.cell(row, methods_col + meth_idx)
-                if shorthand in touch.method_counts:
-                    cell.fill = PatternFill(patternType="solid", fgColor=MATRIX_CELL_FILL)
-                    cell.font = Font(name="Fira Code", size=FONT_SIZE)
-                    if touch.method_counts[shorthand] > 1:
-                        cell.alignment = centre_text
-                        cell.value = touch.method_counts[shorthand]
+                cell = get_cell(row, methods_col + meth_idx)
+                cell.style = "Method Matrix"
+                if touch.method_counts[shorthand] > 1:
+                    cell.alignment = centre_text
+                    cell.value = touch.method_counts[shorthand]
 
     # === FOOTER ===
     footer_row = first_touch_row + len(touches)
     start_col = min(info_col, methods_col)
     # -1 to convert to an exclusive range
     end_col = max(info_col + info_width, methods_col + num_methods) - 1
-    sheet.merge_cells(
+    merge_cells(
         start_row=footer_row,
         start_column=start_col,
         end_row=footer_row,
         end_column=end_col,
     )
-    footer_cell = sheet.cell(footer_row, start_col);
+    footer_cell = get_cell(footer_row, start_col);
     footer_cell.value = FOOTER_TEXT
     footer_cell.alignment = centre_text
     footer_cell.border = Border(left=THICK, top=THICK, bottom=THICK)
-    sheet.cell(footer_row, end_col).border = Border(right=THICK)
+    get_cell(footer_row, end_col).border = Border(right=THICK)
 
     # === ROW/COLUMN SIZES ===
     def get_col(col_idx):
@@ -460,20 +533,25 @@ def write_spreadsheet(method_set: MethodSet, touches: List[Touch], path: str):
     vertical_text_column_width = 2.7
     get_col(length_col).width = 6.5
     get_col(runs_col).width = 5
-    get_col(notes_col).width = max((len(t.notes or "") for t in touches)) * 0.95
-    get_col(calling_col).width = max_len((t.call_string for t in touches)) * 1.3
-    get_col(calling_col + 1).width = max_len((t.calling_position_string for t in touches)) * 1.3
+    max_notes_len = max_call_len = max_calling_pos_len = 0
+    for t in touches:
+        max_notes_len = max(max_notes_len, len(t.notes or ""))
+        max_call_len = max(max_call_len, len(t.call_string))
+        max_calling_pos_len = max(max_calling_pos_len, len(t.calling_position_string))
+    get_col(notes_col).width = max_notes_len * 0.95
+    get_col(calling_col).width = max_call_len * 1.3
+    get_col(calling_col + 1).width = max_calling_pos_len * 1.3
     for method_idx in range(num_methods):
         col_name = get_column_letter(methods_col + method_idx)
         sheet.column_dimensions[col_name].width = vertical_text_column_width
 
     # === BORDERS ===
-    sheet.cell(top_row, info_col).border = Border(top=THICK)
+    get_cell(top_row, info_col).border = Border(top=THICK)
     for i in range(2):
-        sheet.cell(top_row + i, info_col + info_width - 1).border = Border(right=THICK)
+        get_cell(top_row + i, info_col + info_width - 1).border = Border(right=THICK)
     # Column Headers
     for col in range(info_width):
-        sheet.cell(top_row + 2, info_col + col).border = THICK_BOX
+        get_cell(top_row + 2, info_col + col).border = THICK_BOX
     # Methods box
     for method_idx in range(num_methods):
         i = methods_col + method_idx
@@ -485,35 +563,31 @@ def write_spreadsheet(method_set: MethodSet, touches: List[Touch], path: str):
             left = None
         right = THICK if method_idx == num_methods - 1 else None
         # Set the borders
-        sheet.cell(top_row, i).border = Border(
+        get_cell(top_row, i).border = Border(
             left=left,
             top=THICK,
             right=right,
         )
-        sheet.cell(top_row + 2, i).border = Border(
+        get_cell(top_row + 2, i).border = Border(
             left=left,
             right=right,
             top=THICK,
             bottom=THICK,
         )
-    # Touches
-    for touch_idx in range(len(touches)):
-        row = first_touch_row + touch_idx
-        # Determine what line is required under this cell
-        if touch_idx == len(touches) - 1:
-            bottom = THICK  # Thick border at the bottom of the box
-        elif touch_idx % 5 == 4:
-            bottom = NORMAL  # Thin line every 5 rows
-        else:
-            bottom = THIN
+
+    # Touches.  Every row of touches has the same borders apart from the line underneath it, so the
+    # `Border`s for each kind of line are only created once and then shared between rows
+    def touch_row_borders(bottom: Side) -> List[Tuple[int, Border]]:
+        borders = []
         # Info box
         for i in range(0, info_width):
             col = info_col + i
-            sheet.cell(row, col).border = Border(
+            border = Border(
                 left=THICK if col != calling_col + 1 else None,
                 right=THICK if i == info_width - 1 else None,
                 bottom=bottom,
             )
+            borders.append((col, border))
         # Method Matrix
         final_col = num_methods - 1
         for i in range(0, num_methods):
@@ -523,18 +597,36 @@ def write_spreadsheet(method_set: MethodSet, touches: List[Touch], path: str):
                 left = NORMAL
             else:
                 left = THIN
-            sheet.cell(row, methods_col + i).border = Border(
+            border = Border(
                 left=left,
                 right=THICK if i == final_col else None,
                 bottom=bottom,
             )
+            borders.append((methods_col + i, border))
+        return borders
 
-    workbook.save(path)
+    thick_line_borders = touch_row_borders(THICK)
+    normal_line_borders = touch_row_borders(NORMAL)
+    thin_line_borders = touch_row_borders(THIN)
+    for touch_idx in range(len(touches)):
+        row = first_touch_row + touch_idx
+        # Determine what line is required under this cell
+        if touch_idx == len(touches) - 1:
+            borders = thick_line_borders  # Thick border at the bottom of the box
+        elif touch_idx % 5 == 4:
+            borders = normal_line_borders  # Thin line every 5 rows
+        else:
+            borders = thin_line_borders
+        for col, border in borders:
+            get_cell(row, col).border = border
 
+    # === WRITE CELLS ===
+    num_rows = max(row for row, _ in cells)
+    num_cols = max(col for _, col in cells)
+    for row in range(1, num_rows + 1):
+        sheet.append([cells.get((row, col)) for col in range(1, num_cols + 1)])
 
-def max_len(strings: Iterable[str]) -> int:
-    """Returns the maximum length of an `Iterable` of strings"""
-    return max((len(s or "") for s in strings))
+    workbook.save(path)
 
 
 #######################
@@ -546,26 +638,28 @@ def max_len(strings: Iterable[str]) -> int:
 # https://github.com/kneasle/wheatley/blob/9141bf8511dce737208731e55bfe138d48845319/wheatley/row_generation/helpers.py#L57
 
 
-def transpose_row_by_row(lhs: str, rhs: str) -> str:
-    return "".join((lhs[int(ch) - 1] for ch in rhs))
+def transpose_row_by_row(lhs: bytes, rhs: bytes) -> bytes:
+    # Every bell `b` in `rhs` gets replaced by `lhs[b]`.  Padded out to 256 bytes, `lhs` is exactly
+    # the translation table that `bytes.translate` needs to do this in one go
+    return rhs.translate(lhs.ljust(256, b"\x00"))
 
 
-def transpose_row_by_pn(row: str, places: List[int]) -> str:
-    new_row = ""
+def transpose_row_by_pn(row: bytes, places: List[int]) -> bytes:
+    new_row = bytearray()
     index = 0
     while index < len(row):
         place = index + 1
         if place in places:
             # Don't do a swap
-            new_row += row[index]
+            new_row.append(row[index])
             index += 1
         else:
             assert place + 1 not in places
             # Swap two bells round
-            new_row += row[index + 1]
-            new_row += row[index]
+            new_row.append(row[index + 1])
+            new_row.append(row[index])
             index += 2
-    return new_row
+    return bytes(new_row)
 
 
 def parse_pn(pn_str: str, expect_symmetric: bool = False) -> List[List[int]]:
@@ -581,18 +675,22 @@ def parse_pn(pn_str: str, expect_symmetric: bool = False) -> List[List[int]]:
     else:
         symmetric = pn_str.startswith("&")
 
-    # Assumes a valid place notation string is delimited by `.`
-    # These can optionally be omitted around an `-` or `x`
-    # We substitute to ensure `-` is surrounded by `.` and replace any `..` caused by `--` => `.-..-.
-    dot_delimited_string = re.sub("[.]*[x-][.]*", ".-.", pn_str).strip(".&+ ")
-    deduplicated_string = dot_delimited_string.replace("..", ".").split(".")
-
-    # We suppress the type error here, because mypy will assign the list comprehension type 'List[object]',
-    # not 'List[Places]'.
-    converted: List[List[int]] = [
-        [convert_bell_string(y) for y in place] if place != "-" else []  # type: ignore
-        for place in deduplicated_string
-    ]
+    # Assumes a valid place notation string is delimited by `.`, which can optionally be omitted
+    # around an `-` or `x`.  So we scan the string once, finishing the current set of places whenever
+    # we see a `.`, `-` or `x`
+    converted: List[List[int]] = []
+    places: List[int] = []
+    for ch in pn_str.strip("&+ "):
+        if ch in ".x-":
+            if places:
+                converted.append(places)
+                places = []
+            if ch != ".":
+                converted.append([])
+        else:
+            places.append(convert_bell_string(ch))
+    if places:
+        converted.append(places)
 
     if symmetric:
         return converted + list(reversed(converted[:-1]))
@@ -602,8 +700,8 @@ def parse_pn(pn_str: str, expect_symmetric: bool = False) -> List[List[int]]:
 def convert_bell_string(bell: str) -> int:
     """Convert a single-char string representing a bell into an integer."""
     try:
-        return BELL_NAMES.index(bell) + 1
-    except ValueError as e:
+        return BELL_NUMBERS[bell]
+    except KeyError as e:
         raise ValueError(f"'{bell}' is not known bell symbol") from e
 
 